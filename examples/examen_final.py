@@ -18,514 +18,575 @@ Provide a 'Big Bank' example.
 
 Illustrate how to create a software architecture diagram using code, based on
 https://github.com/structurizr/dsl/blob/master/examples/big-bank-plc.dsl.
+
+Set the environment variable `STRUCTURIZR_OFFLINE` to export the diagrams into a
+local `diagrams` directory with the Structurizr CLI instead of uploading them.
 """
 
 
+import functools
+import hashlib
+import json
 import logging
-
+import os
+import subprocess
+import sys
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structurizr
 from structurizr import Workspace
-from structurizr.model import Enterprise, Location, Tags
+from structurizr.model import (
+    Element,
+    Enterprise,
+    Location,
+    Model,
+    Relationship,
+    Tags,
+)
 from structurizr.view import ElementStyle, PaperSize, RelationshipStyle, Shape
-
-
-def main():
-    """Standard entry point for examples.  Do not rename."""
-    return create_big_bank_workspace()
-
-
-def create_big_bank_workspace():
-    """Create the big bank example."""
-
-    workspace = Workspace(
-        name="SCV",
-        description=(
-            "Sistema de Clinica Veterinaria"
-        ),
-    )
-
-    existing_system_tag = "Existing System"
-    business_staff_tag = "Bank Staff"
-    web_browser_tag = "Web Browser"
-    mobile_app_tag = "Mobile App"
-    database_tag = "Database"
-    failover_tag = "Failover"
-    bounded_context_tag = "Bounded Context"
-
-    model = workspace.model
-    views = workspace.views
-
-    model.enterprise = Enterprise(name="Veterinaria Mi Mascota Feliz")
-
-    # people and software systems
-    cliente = model.add_person(
-        location=Location.External,
-        name="Cliente",
-        description="Persona dueña o responsable de una mascota.",
-        id="cliente",
-    )
-
-    jefe_rrh = model.add_person(
-        location=Location.Internal,
-        name="Jefatura de recursos humanos",
-        description="La persona de gestiona las cargas horarias de los personal_medicos",
-        id="jefeRrh",
-    )
-    jefe_rrh.tags.add(business_staff_tag)
-    #cliente.interacts_with(
-    #    jefe_rrh, "Asks questions to", technology="Telephone"
-    #)
-
-    personal_medico = model.add_person(
-        location=Location.Internal,
-        name="personal_medico",
-        description="Personal Medico y Personal Tecnico en veterinaria",
-        id="personalMedico",
-    )
-    personal_medico.tags.add(business_staff_tag)
-
-    sistema_gestion_citas_context_container = model.add_software_system(
-        location=Location.Internal,
-        name="Sistema de Clinica Veterinaria",
-        description=(
-            "Sistema de Gestion de atencioniones Veterinarias"
-        ),
-        id="sistemaGestionCitasMedicas",
-    )
-
-    cliente.uses(
-        sistema_gestion_citas_context_container, "Agenda una cita con su medico pefrerido"
-    )
-    jefe_rrh.uses(sistema_gestion_citas_context_container, "Registra la carga horario del personal medico")
-    personal_medico.uses(sistema_gestion_citas_context_container, "Consulta su carga horaria. Registra el diagnostico y recetas")
-    
-   
-       
-    email_system = model.add_software_system(
-        location=Location.External,
-        name="Gmail",
-        description="Gmail",
-        id="email",
-    )
-    email_system.tags.add(existing_system_tag)
-    email_system.delivers(
-        destination=cliente,
-        description="Sends e-mails to",
-    )
-    sistema_gestion_citas_context_container.uses(
-        destination=email_system,
-        description="Sends e-mail using",
-    )
-
-    whatsapp_system = model.add_software_system(
-        location=Location.External,
-        name="Whatsapp",
-        description="Whatsapp",
-        id="whatsappSystem",
-    )
-    whatsapp_system.tags.add(existing_system_tag)
-    whatsapp_system.delivers(
-        destination=cliente,
-        description="Envia mensajes de texto",
-    )
-    sistema_gestion_citas_context_container.uses(
-        destination=whatsapp_system,
-        description="Envia mensajes de texto",
-    )
-     
-    # containers
-    portal = sistema_gestion_citas_context_container.add_container(
-        name="Portal Institucional",
-        description="Web Estatica con informacion de la Organizacion.",
-        technology = "Flutter",
-        id="portal",
-    )
-    portal.tags.add(web_browser_tag)
-    cliente.uses(portal, "")
-    sistema_gestion_citas_context_container.uses(portal, "Publica Promociones")
-
-    single_page_application = sistema_gestion_citas_context_container.add_container(
+from structurizr.view.styles import Styles
+
+
+EXISTING_SYSTEM_TAG = sys.intern("Existing System")
+BUSINESS_STAFF_TAG = sys.intern("Bank Staff")
+WEB_BROWSER_TAG = sys.intern("Web Browser")
+MOBILE_APP_TAG = sys.intern("Mobile App")
+DATABASE_TAG = sys.intern("Database")
+FAILOVER_TAG = sys.intern("Failover")
+BOUNDED_CONTEXT_TAG = sys.intern("Bounded Context")
+
+
+class Tech(str, Enum):
+    """Define the technologies used by relationships in this example."""
+
+    JSON_HTTPS = "JSON/HTTPS"
+    SMTP = "SMTP"
+    JDBC = "JDBC"
+
+
+# (location, name, description, id, tags)
+PEOPLE = [
+    (
+        Location.External,
+        "Cliente",
+        "Persona dueña o responsable de una mascota.",
+        "cliente",
+        (),
+    ),
+    (
+        Location.Internal,
+        "Jefatura de recursos humanos",
+        "La persona de gestiona las cargas horarias de los personal_medicos",
+        "jefeRrh",
+        (BUSINESS_STAFF_TAG,),
+    ),
+    (
+        Location.Internal,
+        "personal_medico",
+        "Personal Medico y Personal Tecnico en veterinaria",
+        "personalMedico",
+        (BUSINESS_STAFF_TAG,),
+    ),
+]
+
+# (location, name, description, id, tags)
+SOFTWARE_SYSTEMS = [
+    (
+        Location.Internal,
+        "Sistema de Clinica Veterinaria",
+        "Sistema de Gestion de atencioniones Veterinarias",
+        "sistemaGestionCitasMedicas",
+        (),
+    ),
+    (Location.External, "Gmail", "Gmail", "email", (EXISTING_SYSTEM_TAG,)),
+    (
+        Location.External,
+        "Whatsapp",
+        "Whatsapp",
+        "whatsappSystem",
+        (EXISTING_SYSTEM_TAG,),
+    ),
+]
+
+# (software system id, name, description, technology, id, tags)
+CONTAINERS = [
+    (
+        "sistemaGestionCitasMedicas",
+        "Portal Institucional",
+        "Web Estatica con informacion de la Organizacion.",
+        "Flutter",
+        "portal",
+        (WEB_BROWSER_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Single-Page Application",
-        "Provee la funcionalidad para reservar cita medica, visualizar historial medico.",
+        "Provee la funcionalidad para reservar cita medica, visualizar historial "
+        "medico.",
         "Flutter",
-        id="singlePageApplication",
-    )
-    single_page_application.tags.add(web_browser_tag)
-    cliente.uses(single_page_application, "Uses", technology="JSON/HTTPS")
-    jefe_rrh.uses(single_page_application, "Uses", technology="JSON/HTTPS")
-    personal_medico.uses(single_page_application, "Uses", technology="JSON/HTTPS")
-
-    mobile_app = sistema_gestion_citas_context_container.add_container(
+        "singlePageApplication",
+        (WEB_BROWSER_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Mobile App",
         "Provee funcionalidad de avisos y comunicacion hacia los clientes.",
         "Flutter",
-        id="mobileApp",
-    )
-    mobile_app.tags.add(mobile_app_tag)
-    cliente.uses(mobile_app, "Uses")
-
-    
-    api_application_container = sistema_gestion_citas_context_container.add_container(
+        "mobileApp",
+        (MOBILE_APP_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "API Gateway",
         "Provee los EndPoints via a JSON/HTTPS API.",
         "NestJs",
-        id="apiApplication",
-    )
-    api_application_container.uses(email_system, "Sends e-mail using", technology="SMTP")
-    api_application_container.uses(whatsapp_system, "Envia mensajes", technology="JSON/HTTPS")
-    single_page_application.uses(api_application_container, "Makes API calls to" "JSON/HTTPS")
-    mobile_app.uses(api_application_container, "Makes API calls to" "JSON/HTTPS")
-    portal.uses(api_application_container, "Makes API calls to" "JSON/HTTPS")
-
-    cliente_context_container = sistema_gestion_citas_context_container.add_container(
+        "apiApplication",
+        (),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Contexto cliente",
         "Provee las funcionalidades para manejar el agregado cliente",
         "NestJs",
-        id="clienteContext",
-    )
-    cliente_context_container.tags.add(bounded_context_tag)
-    api_application_container.uses(cliente_context_container, "")
-
-    paciente_context_container = sistema_gestion_citas_context_container.add_container(
+        "clienteContext",
+        (BOUNDED_CONTEXT_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Contexto Paciente",
         "Provee las funcionalidades para manejar el agregado Paciente",
         "NestJs",
-        id="pacienteContext",
-    )
-    paciente_context_container.tags.add(bounded_context_tag)
-    api_application_container.uses(paciente_context_container, "")
-
-    comprobante_context_container = sistema_gestion_citas_context_container.add_container(
+        "pacienteContext",
+        (BOUNDED_CONTEXT_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Contexto Comprobante",
         "Provee las funcionalidades para manejar el agregado Comprobante",
         "NestJs",
-        id="comprobanteContext",
-    )
-    comprobante_context_container.tags.add(bounded_context_tag)
-    api_application_container.uses(comprobante_context_container, "")
-
-    cargahoraria_context_container = sistema_gestion_citas_context_container.add_container(
+        "comprobanteContext",
+        (BOUNDED_CONTEXT_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Contexto Carga Horaria",
         "Provee las funcionalidades para manejar el agregado Carga Horaria",
         "NestJs",
-        id="cargahorariaContext",
-    )
-    cargahoraria_context_container.tags.add(bounded_context_tag)
-    api_application_container.uses(cargahoraria_context_container, "")
-
-    citas_context_container = sistema_gestion_citas_context_container.add_container(
+        "cargahorariaContext",
+        (BOUNDED_CONTEXT_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Contexto Citas Medicas",
         "Provee las funcionalidades para manejar el agregado Citas a medicas",
         "NestJs",
-        id="citasMedicas",
-    )
-    citas_context_container.tags.add(bounded_context_tag)
-    api_application_container.uses(citas_context_container, "")
-
-    cirugias_context_container = sistema_gestion_citas_context_container.add_container(
+        "citasMedicas",
+        (BOUNDED_CONTEXT_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Contexto Cirugia Medicas",
         "Provee las funcionalidades para manejar el agregado Cirugia Medicas",
         "NestJs",
-        id="cirugiasMedicas",
-    )
-    cirugias_context_container.tags.add(bounded_context_tag)
-    api_application_container.uses(cirugias_context_container, "")
-
-    database = sistema_gestion_citas_context_container.add_container(
+        "cirugiasMedicas",
+        (BOUNDED_CONTEXT_TAG,),
+    ),
+    (
+        "sistemaGestionCitasMedicas",
         "Database",
         "Stores user registration information, hashed authentication credentials, "
         "access logs, etc.",
         "Relational Database Schema",
-        id="database",
-    )
-    
-    database.tags.add(database_tag)
-    cliente_context_container.uses(database, "Guarda los clientes")
-    paciente_context_container.uses(database , "Guarda los datos de los pacientes")
-    citas_context_container.uses(database, "Guarda los datos de la consulta, diagnistico y prescipcion")
-    cirugias_context_container.uses(database, "Guarda los datos de la cirugia")
-    comprobante_context_container.uses(database, "Guarda los datos de la cirugia")
-    cargahoraria_context_container.uses(database, "Guarda los datos de la cirugia")
+        "database",
+        (DATABASE_TAG,),
+    ),
+]
+
+# COMPONENTS
+# - for a real-world software system, you would probably want to extract the
+#   components using static analysis/reflection rather than manually specifying
+#   them all
+#
+# (container id, name, description, technology, id)
+COMPONENTS = [
+    # apiApplication
+    (
+        "apiApplication",
+        "Sign In Controller",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "signinController",
+    ),
+    (
+        "apiApplication",
+        "Reset Password Controller",
+        "Allows users to reset their passwords with a single use URL.",
+        "NestJs - TypeScript",
+        "resetPasswordController",
+    ),
+    (
+        "apiApplication",
+        "E-mail Component",
+        "Sends e-mails to users.",
+        "NestJs - TypeScript",
+        "emailComponent",
+    ),
+    (
+        "apiApplication",
+        "Security Component",
+        "Provides functionality related to signing in, changing passwords, etc.",
+        "NestJs - TypeScript, GoogleAuth",
+        "securityComponent",
+    ),
+    # pacienteContext
+    (
+        "pacienteContext",
+        "Convocatoria Controller",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "convocatoriaControllerComponent",
+    ),
+    (
+        "pacienteContext",
+        "Convocatoria Application Service",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "convocatoriaServiceComponent",
+    ),
+    (
+        "pacienteContext",
+        "Convocatoria Repository",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "convocatoriaRepository",
+    ),
+    (
+        "pacienteContext",
+        "Convocatoria Query",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "convocatoriaQuery",
+    ),
+    # clienteContext
+    (
+        "clienteContext",
+        "cliente Controller",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "clienteControllerComponent",
+    ),
+    (
+        "clienteContext",
+        "cliente Application Service",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "clienteServiceComponent",
+    ),
+    (
+        "clienteContext",
+        "cliente Repository",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "clienteRepository",
+    ),
+    (
+        "clienteContext",
+        "cliente Query",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "clienteQuery",
+    ),
+    # citasMedicas
+    (
+        "citasMedicas",
+        "Evaluaciones Controller",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "evaluacionesControllerComponent",
+    ),
+    (
+        "citasMedicas",
+        "Evaluaciones Application Service",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "evaluacionesServiceComponent",
+    ),
+    (
+        "citasMedicas",
+        "Evaluaciones Repository",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "evaluacionesRepository",
+    ),
+    (
+        "citasMedicas",
+        "Evaluaciones Query",
+        "Allows users to sign in to the Internet Banking System.",
+        "NestJs - TypeScript",
+        "evaluacionesQuery",
+    ),
+]
+
+# (source id, destination id, description, technology)
+RELATIONSHIPS = [
+    # people and software systems
+    (
+        "cliente",
+        "sistemaGestionCitasMedicas",
+        "Agenda una cita con su medico pefrerido",
+        "",
+    ),
+    (
+        "jefeRrh",
+        "sistemaGestionCitasMedicas",
+        "Registra la carga horario del personal medico",
+        "",
+    ),
+    (
+        "personalMedico",
+        "sistemaGestionCitasMedicas",
+        "Consulta su carga horaria. Registra el diagnostico y recetas",
+        "",
+    ),
+    ("email", "cliente", "Sends e-mails to", ""),
+    ("sistemaGestionCitasMedicas", "email", "Sends e-mail using", ""),
+    ("whatsappSystem", "cliente", "Envia mensajes de texto", ""),
+    ("sistemaGestionCitasMedicas", "whatsappSystem", "Envia mensajes de texto", ""),
+    # containers
+    ("cliente", "portal", "", ""),
+    ("sistemaGestionCitasMedicas", "portal", "Publica Promociones", ""),
+    ("cliente", "singlePageApplication", "Uses", Tech.JSON_HTTPS),
+    ("jefeRrh", "singlePageApplication", "Uses", Tech.JSON_HTTPS),
+    ("personalMedico", "singlePageApplication", "Uses", Tech.JSON_HTTPS),
+    ("cliente", "mobileApp", "Uses", ""),
+    ("apiApplication", "email", "Sends e-mail using", Tech.SMTP),
+    ("apiApplication", "whatsappSystem", "Envia mensajes", Tech.JSON_HTTPS),
+    ("singlePageApplication", "apiApplication", "Makes API calls to", Tech.JSON_HTTPS),
+    ("mobileApp", "apiApplication", "Makes API calls to", Tech.JSON_HTTPS),
+    ("portal", "apiApplication", "Makes API calls to", Tech.JSON_HTTPS),
+    ("apiApplication", "clienteContext", "", ""),
+    ("apiApplication", "pacienteContext", "", ""),
+    ("apiApplication", "comprobanteContext", "", ""),
+    ("apiApplication", "cargahorariaContext", "", ""),
+    ("apiApplication", "citasMedicas", "", ""),
+    ("apiApplication", "cirugiasMedicas", "", ""),
+    ("clienteContext", "database", "Guarda los clientes", ""),
+    ("pacienteContext", "database", "Guarda los datos de los pacientes", ""),
+    (
+        "citasMedicas",
+        "database",
+        "Guarda los datos de la consulta, diagnistico y prescipcion",
+        "",
+    ),
+    ("cirugiasMedicas", "database", "Guarda los datos de la cirugia", ""),
+    ("comprobanteContext", "database", "Guarda los datos de la cirugia", ""),
+    ("cargahorariaContext", "database", "Guarda los datos de la cirugia", ""),
+    # apiApplication components
+    (
+        "singlePageApplication",
+        "signinController",
+        "Makes API calls to",
+        Tech.JSON_HTTPS,
+    ),
+    ("mobileApp", "signinController", "Makes API calls to", Tech.JSON_HTTPS),
+    (
+        "singlePageApplication",
+        "resetPasswordController",
+        "Makes API calls to",
+        Tech.JSON_HTTPS,
+    ),
+    ("mobileApp", "resetPasswordController", "Makes API calls to", Tech.JSON_HTTPS),
+    ("emailComponent", "email", "Sends e-mail using", Tech.SMTP),
+    ("resetPasswordController", "emailComponent", "Uses", ""),
+    ("securityComponent", "database", "Reads from and writes to", Tech.JDBC),
+    ("signinController", "securityComponent", "Uses", ""),
+    ("resetPasswordController", "securityComponent", "Uses", ""),
+    # pacienteContext components
+    ("apiApplication", "convocatoriaControllerComponent", "Uses", ""),
+    ("convocatoriaControllerComponent", "convocatoriaServiceComponent", "Uses", ""),
+    ("convocatoriaRepository", "database", "Uses", ""),
+    ("convocatoriaServiceComponent", "convocatoriaRepository", "Uses", ""),
+    ("convocatoriaQuery", "database", "Uses", ""),
+    ("convocatoriaControllerComponent", "convocatoriaQuery", "Uses", ""),
+    # clienteContext components
+    ("apiApplication", "clienteControllerComponent", "Uses", ""),
+    ("clienteControllerComponent", "clienteServiceComponent", "Uses", ""),
+    ("clienteRepository", "database", "Uses", ""),
+    ("clienteServiceComponent", "clienteRepository", "Uses", ""),
+    ("clienteQuery", "database", "Uses", ""),
+    ("clienteControllerComponent", "clienteQuery", "Uses", ""),
+    # citasMedicas components
+    ("apiApplication", "evaluacionesControllerComponent", "Uses", ""),
+    ("evaluacionesControllerComponent", "evaluacionesServiceComponent", "Uses", ""),
+    ("evaluacionesRepository", "database", "Uses", ""),
+    ("evaluacionesServiceComponent", "evaluacionesRepository", "Uses", ""),
+    ("evaluacionesQuery", "database", "Uses", ""),
+    ("evaluacionesControllerComponent", "evaluacionesQuery", "Uses", ""),
+]
+
+
+# colours, shapes and other diagram styling, keyed by tag
+_STYLE_SPEC: Dict[str, Dict[str, Any]] = {
+    Tags.SOFTWARE_SYSTEM: {"background": "#1168bd", "color": "#ffffff"},
+    Tags.CONTAINER: {"background": "#438dd5", "color": "#ffffff"},
+    Tags.COMPONENT: {"background": "#85bbf0", "color": "#000000"},
+    Tags.PERSON: {
+        "background": "#08427b",
+        "color": "#ffffff",
+        "shape": Shape.Person,
+        "font_size": 22,
+    },
+    EXISTING_SYSTEM_TAG: {"background": "#999999", "color": "#ffffff"},
+    BUSINESS_STAFF_TAG: {"background": "#999999", "color": "#ffffff"},
+    WEB_BROWSER_TAG: {"shape": Shape.WebBrowser},
+    MOBILE_APP_TAG: {"shape": Shape.MobileDeviceLandscape},
+    DATABASE_TAG: {"shape": Shape.Cylinder},
+    FAILOVER_TAG: {"opacity": 25},
+    BOUNDED_CONTEXT_TAG: {"shape": Shape.Hexagon, "background": "#facc2e"},
+}
+_RELATIONSHIP_STYLE_SPEC: Dict[str, Dict[str, Any]] = {
+    FAILOVER_TAG: {"opacity": 25, "position": 70},
+}
+
+
+class LazyStyles(Styles):
+    """Styles whose element styles are only created once they are read."""
+
+    def __init__(
+        self,
+        spec: Dict[str, Dict[str, Any]],
+        *,
+        elements: Iterable[ElementStyle] = (),
+        **kwargs,
+    ) -> None:
+        """Keep the element style specification keyed by tag."""
+        super().__init__(**kwargs)
+        self._spec = spec
+        # Explicitly given element styles follow those from the specification.
+        self._extra_elements = list(elements)
+        self._elements: Optional[List[ElementStyle]] = None
+
+    @property
+    def elements(self) -> List[ElementStyle]:
+        """Return the element styles, creating them on first access."""
+        if self._elements is None:
+            self._elements = [
+                ElementStyle(tag=tag, **attributes)
+                for tag, attributes in self._spec.items()
+            ]
+            self._elements.extend(self._extra_elements)
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: List[ElementStyle]) -> None:
+        """Replace the element styles, including those from the specification."""
+        self._elements = elements
 
 
-    
-    
-    #web_application.uses(
-    #    single_page_application, "Delivers to the clientes web browser"
-    #)
-    #api_application_container.uses(database, "Reads from and writes to", technology="JDBC")
-    #api_application_container.uses(mainframe_business_system, "Uses", technology="XML/HTTPS")
-    
+def main():
+    """Standard entry point for examples.  Do not rename."""
+    return create_big_bank_workspace()
 
 
-    
-    # COMPONENTS
-    # - for a real-world software system, you would probably want to extract the
-    #   components using static analysis/reflection rather than manually specifying
-    #   them all
-
-    # api_application_container - COMPONENTS
-    signin_controller_component = api_application_container.add_component(
-        name="Sign In Controller",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="signinController",
-    )
-    single_page_application.uses(signin_controller_component, "Makes API calls to", "JSON/HTTPS")
-    mobile_app.uses(signin_controller_component, "Makes API calls to", "JSON/HTTPS")
-
-    reset_password_controller_component = api_application_container.add_component(
-        name="Reset Password Controller",
-        description="Allows users to reset their passwords with a single use URL.",
-        technology="NestJs - TypeScript",
-        id="resetPasswordController",
-    )
-    single_page_application.uses(reset_password_controller_component, "Makes API calls to", "JSON/HTTPS")
-    mobile_app.uses(reset_password_controller_component, "Makes API calls to", "JSON/HTTPS")
-
-    email_component = api_application_container.add_component(
-        name="E-mail Component",
-        description="Sends e-mails to users.",
-        technology="NestJs - TypeScript",
-        id="emailComponent",
-    )
-    email_component.uses(email_system, "Sends e-mail using", technology="SMTP")
-    reset_password_controller_component.uses(email_component, "Uses")
-
-    security_component = api_application_container.add_component(
-        name="Security Component",
-        description="Provides functionality related to signing in, changing passwords, etc.",
-        technology="NestJs - TypeScript, GoogleAuth",
-        id="securityComponent",
-    )
-    security_component.uses(database, "Reads from and writes to", "JDBC")
-    signin_controller_component.uses(security_component, "Uses")
-    reset_password_controller_component.uses(security_component, "Uses")
-    
-    #paciente_context_container - COMPONENTS
-    convocatoria_controller_component = paciente_context_container.add_component(
-        name="Convocatoria Controller",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="convocatoriaControllerComponent",
-    )
-    api_application_container.uses(convocatoria_controller_component)
-    
-    convocatoria_service_component = paciente_context_container.add_component(
-        name="Convocatoria Application Service",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="convocatoriaServiceComponent",
-    )
-    convocatoria_controller_component.uses(convocatoria_service_component)
+def _bulk_add(
+    model: Model,
+    people: Iterable[tuple],
+    software_systems: Iterable[tuple],
+    containers: Iterable[tuple],
+    components: Iterable[tuple],
+) -> Dict[str, Element]:
+    """Add the tabulated elements to the model in one pass per kind."""
+    elements = {}
+    for location, name, description, id, tags in people:
+        elements[id] = model.add_person(
+            location=location, name=name, description=description, id=id, tags=tags
+        )
+    for location, name, description, id, tags in software_systems:
+        elements[id] = model.add_software_system(
+            location=location, name=name, description=description, id=id, tags=tags
+        )
+    for parent_id, name, description, technology, id, tags in containers:
+        elements[id] = elements[parent_id].add_container(
+            name, description, technology, id=id, tags=tags
+        )
+    for parent_id, name, description, technology, id in components:
+        elements[id] = elements[parent_id].add_component(
+            name=name, description=description, technology=technology, id=id
+        )
+    return elements
+
+
+def _add_relationships(model: Model, relationships: Iterable[tuple]) -> None:
+    """Add the tabulated relationships to the model, skipping duplicate entries."""
+    seen = set()
+    batch = []
+    for source_id, destination_id, description, technology in relationships:
+        key = (source_id, destination_id, description)
+        if key in seen:
+            continue
+        seen.add(key)
+        batch.append(
+            Relationship(
+                source=model.get_element(source_id),
+                destination=model.get_element(destination_id),
+                description=description,
+                technology=technology,
+            )
+        )
+    model.add_relationships(batch)
+
+
+def create_big_bank_workspace(readonly: bool = False) -> Workspace:
+    """
+    Create the big bank example.
 
-    convocatoria_repository_component = paciente_context_container.add_component(
-        name="Convocatoria Repository",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="convocatoriaRepository",
-    )
-    convocatoria_repository_component.uses(database)
-    convocatoria_service_component.uses(convocatoria_repository_component)
-
-    convocatoria_query_component = paciente_context_container.add_component(
-        name="Convocatoria Query",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="convocatoriaQuery",
-    )
-    convocatoria_query_component.uses(database)
-    convocatoria_controller_component.uses(convocatoria_query_component)
-    
-    # cliente_context_container - COMPONENTS
-    cliente_controller_component = cliente_context_container.add_component(
-        name="cliente Controller",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="clienteControllerComponent",
-    )
-    api_application_container.uses(cliente_controller_component)
-    
-    cliente_service_component = cliente_context_container.add_component(
-        name="cliente Application Service",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="clienteServiceComponent",
-    )
-    cliente_controller_component.uses(cliente_service_component)
+    Args:
+        readonly (bool, optional): Return a workspace that is shared between calls
+            instead of building a new one (default `False`). The shared workspace
+            must not be modified. Use `create_big_bank_workspace.cache_clear()` to
+            discard it.
 
-    cliente_repository_component = cliente_context_container.add_component(
-        name="cliente Repository",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="clienteRepository",
-    )
-    cliente_repository_component.uses(database)
-    cliente_service_component.uses(cliente_repository_component)
-
-    cliente_query_component = cliente_context_container.add_component(
-        name="cliente Query",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="clienteQuery",
-    )
-    cliente_query_component.uses(database)
-    cliente_controller_component.uses(cliente_query_component)
-
-    # citas_context_container - COMPONENTS
-    evaluaciones_controller_component = citas_context_container.add_component(
-        name="Evaluaciones Controller",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="evaluacionesControllerComponent",
-    )
-    api_application_container.uses(evaluaciones_controller_component)
-    
-    evaluaciones_service_component = citas_context_container.add_component(
-        name="Evaluaciones Application Service",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="evaluacionesServiceComponent",
-    )
-    evaluaciones_controller_component.uses(evaluaciones_service_component)
+    """
+    if readonly:
+        return _create_shared_workspace()
+    return _build_big_bank_workspace()
 
-    evaluaciones_repository_component = citas_context_container.add_component(
-        name="Evaluaciones Repository",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="evaluacionesRepository",
-    )
-    evaluaciones_repository_component.uses(database)
-    evaluaciones_service_component.uses(evaluaciones_repository_component)
-
-    evaluaciones_query_component = citas_context_container.add_component(
-        name="Evaluaciones Query",
-        description="Allows users to sign in to the Internet Banking System.",
-        technology="NestJs - TypeScript",
-        id="evaluacionesQuery",
-    )
-    evaluaciones_query_component.uses(database)
-    evaluaciones_controller_component.uses(evaluaciones_query_component)
 
-    """
-    # TODO:!
-    # model.AddImplicitRelationships()
-
-    # deployment nodes and container instances
-    developer_laptop = model.add_deployment_node(
-        environment="Development",
-        name="Developer Laptop",
-        description="A developer laptop.",
-        technology="Microsoft Windows 10 or Apple macOS",
-    )
-    apache_tomcat = developer_laptop.add_deployment_node(
-        name="Docker - Web Server",
-        description="A Docker container.",
-        technology="Docker",
-    ).add_deployment_node(
-        name="Apache Tomcat",
-        description="An open source Java EE web server.",
-        technology="Apache Tomcat 8.x",
-        instances=1,
-        properties={"Xmx": "512M", "Xms": "1024M", "Java Version": "8"},
-    )
-    apache_tomcat.add_container(web_application)
-    apache_tomcat.add_container(api_application_container)
-
-    developer_laptop.add_deployment_node(
-        "Docker - Database Server", "A Docker container.", "Docker"
-    ).add_deployment_node(
-        "Database Server", "A development database.", "Oracle 12c"
-    ).add_container(
-        database
-    )
+@functools.lru_cache(maxsize=1)
+def _create_shared_workspace() -> Workspace:
+    return _build_big_bank_workspace()
 
-    developer_laptop.add_deployment_node(
-        "Web Browser", "", "Chrome, Firefox, Safari, or Edge"
-    ).add_container(single_page_application)
 
-    cliente_mobile_device = model.add_deployment_node(
-        "Customer's mobile device", "", "Apple iOS or Android", environment="Live"
-    )
-    cliente_mobile_device.add_container(mobile_app)
+create_big_bank_workspace.cache_clear = _create_shared_workspace.cache_clear
 
-    cliente_computer = model.add_deployment_node(
-        "Customer's computer",
-        "",
-        "Microsoft Windows or Apple macOS",
-        environment="Live",
-    )
-    cliente_computer.add_deployment_node(
-        "Web Browser", "", "Chrome, Firefox, Safari, or Edge"
-    ).add_container(single_page_application)
 
-    big_bank_data_center = model.add_deployment_node(
-        "Big Bank plc", "", "Big Bank plc data center", environment="Live"
+def _build_big_bank_workspace() -> Workspace:
+    """Build a new instance of the big bank example."""
+    workspace = Workspace(
+        name="SCV",
+        description=(
+            "Sistema de Clinica Veterinaria"
+        ),
     )
 
-    live_web_server = big_bank_data_center.add_deployment_node(
-        "bigbank-web***",
-        "A web server residing in the web server farm, accessed via F5 BIG-IP LTMs.",
-        "Ubuntu 16.04 LTS",
-        instances=4,
-        properties={"Location": "London and Reading"},
-    )
-    live_web_server.add_deployment_node(
-        "Apache Tomcat",
-        "An open source Java EE web server.",
-        "Apache Tomcat 8.x",
-        instances=1,
-        properties={"Xmx": "512M", "Xms": "1024M", "Java Version": "8"},
-    ).add_container(web_application)
-
-    live_api_server = big_bank_data_center.add_deployment_node(
-        "bigbank-api***",
-        "A web server residing in the web server farm, accessed via F5 BIG-IP LTMs.",
-        "Ubuntu 16.04 LTS",
-        instances=8,
-        properties={"Location": "London and Reading"},
-    )
-    live_api_server.add_deployment_node(
-        "Apache Tomcat",
-        "An open source Java EE web server.",
-        "Apache Tomcat 8.x",
-        instances=1,
-        properties={"Xmx": "512M", "Xms": "1024M", "Java Version": "8"},
-    ).add_container(api_application_container)
-
-    primary_database_server = big_bank_data_center.add_deployment_node(
-        "bigbank-db01",
-        "The primary database server.",
-        "Ubuntu 16.04 LTS",
-        instances=1,
-        properties={"Location": "London"},
-    ).add_deployment_node(
-        "Oracle - Primary", "The primary, live database server.", "Oracle 12c"
-    )
-    primary_database_server.add_container(database)
-
-    big_bank_db_02 = big_bank_data_center.add_deployment_node(
-        "bigbank-db02",
-        "The secondary database server.",
-        "Ubuntu 16.04 LTS",
-        instances=1,
-        properties={"Location": "Reading"},
-    )
-    big_bank_db_02.tags.add(failover_tag)
-    secondary_database_server = big_bank_db_02.add_deployment_node(
-        "Oracle - Secondary",
-        "A secondary, standby database server, used for failover purposes only.",
-        "Oracle 12c",
-    )
-    secondary_database_server.tags.add(failover_tag)
-    secondary_database = secondary_database_server.add_container(database)
+    model = workspace.model
+    views = workspace.views
+
+    model.enterprise = Enterprise(name="Veterinaria Mi Mascota Feliz")
+
+    elements = _bulk_add(model, PEOPLE, SOFTWARE_SYSTEMS, CONTAINERS, COMPONENTS)
+    # Resolve relationships only once all of their endpoints exist.
+    _add_relationships(model, RELATIONSHIPS)
+    cliente = elements["cliente"]
+    jefe_rrh = elements["jefeRrh"]
+    personal_medico = elements["personalMedico"]
+    sistema_gestion_citas_context_container = elements["sistemaGestionCitasMedicas"]
+    email_system = elements["email"]
+    whatsapp_system = elements["whatsappSystem"]
 
-    # model.Relationships.Where(r=>r.Destination.Equals(secondary_database)).ToList()
-    #   .ForEach(r=>r.tags.add(failover_tag))
-    data_replication_relationship = primary_database_server.uses(
-        secondary_database_server, "Replicates data to"
-    )
-    secondary_database.tags.add(failover_tag)
-    """
     # views/diagrams
     system_landscape_view = views.create_system_landscape_view(
         key="SystemLandscape",
@@ -599,100 +660,136 @@ def create_big_bank_workspace():
     # component_evaluacionesContext_view.add_all_components()
     # component_evaluacionesContext_view.paper_size = PaperSize.A4_Landscape
 
-
-    """
-    # systemLandscapeView.AddAnimation(sistema_gestion_citas_context_container, cliente,
-    #   mainframe_business_system, emailSystem)
-    # systemLandscapeView.AddAnimation(portal)
-    # systemLandscapeView.AddAnimation(clienteServiceStaff, personal_medico)
-
-    # systemContextView.AddAnimation(sistema_gestion_citas_context_container)
-    # systemContextView.AddAnimation(cliente)
-    # systemContextView.AddAnimation(mainframe_business_system)
-    # systemContextView.AddAnimation(emailSystem)
-
-    # containerView.AddAnimation(cliente, mainframe_business_system, emailSystem)
-    # containerView.AddAnimation(webApplication)
-    # containerView.AddAnimation(singlePageApplication)
-    # containerView.AddAnimation(mobile_app)
-    # containerView.AddAnimation(apiApplication)
-    # containerView.AddAnimation(database)
-
-    # componentView.AddAnimation(singlePageApplication, mobile_app)
-    # componentView.AddAnimation(signinController, securityComponent, database)
-    # componentView.AddAnimation(accountsSummaryController,
-    #   mainframe_business_systemFacade, mainframe_business_system)
-    # componentView.AddAnimation(resetPasswordController, emailComponent, database)
-
-    dynamic_view = views.create_dynamic_view(
-        element=api_application_container,
-        key="SignIn",
-        description="Summarises how the sign in feature works in the single-page application.",
-    )
-    dynamic_view.add(
-        single_page_application, signin_controller_component, "Submits credentials to"
-    )
-    dynamic_view.add(
-        signin_controller_component, security_component, "Calls isAuthenticated() on"
-    )
-    dynamic_view.add(
-        security_component, database, "select * from users where username = ?"
+    # colours, shapes and other diagram styling
+    views.configuration.styles = LazyStyles(
+        _STYLE_SPEC,
+        relationships=[
+            RelationshipStyle(tag=tag, **attributes)
+            for tag, attributes in _RELATIONSHIP_STYLE_SPEC.items()
+        ],
     )
-    dynamic_view.paper_size = PaperSize.A5_Landscape
 
-    development_deployment_view = views.create_deployment_view(
-        software_system=sistema_gestion_citas_context_container,
-        key="DevelopmentDeployment",
-        description="An example development deployment scenario for the Internet "
-        "Banking System.",
-        environment="Development",
-    )
-    development_deployment_view.add(developer_laptop)
-    development_deployment_view.paper_size = PaperSize.A5_Landscape
+    return workspace
 
-    live_deployment_view = views.create_deployment_view(
-        software_system=sistema_gestion_citas_context_container,
-        key="LiveDeployment",
-        description="An example live deployment scenario for the Internet Banking "
-        "System.",
-        environment="Live",
-    )
-    live_deployment_view += big_bank_data_center
-    live_deployment_view += cliente_mobile_device
-    live_deployment_view += cliente_computer
-    live_deployment_view += data_replication_relationship
-    live_deployment_view.paper_size = PaperSize.A5_Landscape
+
+CACHE_PATH = Path.home() / ".cache" / "structurizr_scv.json"
+WORKSPACE_CACHE_PATH = CACHE_PATH.with_suffix(".json.gz")
+
+
+def source_digest() -> str:
+    """Return a SHA-256 digest of this example's and the structurizr package's code."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    # Hash the library's sources rather than its version, so that changes to an
+    # editable or development install also invalidate the cached workspace.
+    package = Path(structurizr.__file__).parent
+    for path in sorted(package.rglob("*.py")):
+        digest.update(str(path.relative_to(package)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _freeze(obj: Any) -> Any:
+    """Sort lists of identified objects, which are serialized from sets."""
+    if isinstance(obj, dict):
+        return {key: _freeze(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        items = [_freeze(item) for item in obj]
+        if all(isinstance(item, dict) and "id" in item for item in items):
+            items.sort(key=lambda item: item["id"])
+        return items
+    return obj
+
+
+def workspace_digest(workspace: Workspace) -> str:
+    """Return a SHA-256 digest of the workspace's canonical JSON representation."""
+    canonical = json.dumps(_freeze(json.loads(workspace.dumps())), sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def read_cache(path: Path = CACHE_PATH) -> dict:
+    """Return the cached workspace entry or an empty one."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_cache(
+    entry: dict, workspace: Optional[Workspace] = None, path: Path = CACHE_PATH
+) -> None:
+    """Store the given entry and, if given, the gzipped workspace in the cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if workspace is not None:
+        workspace.dump(WORKSPACE_CACHE_PATH, compresslevel=1)
+    path.write_text(json.dumps(entry))
+
+
+def build_workspace(cache: dict) -> Tuple[Workspace, dict]:
+    """Build the workspace and a fresh cache entry for it."""
+    workspace = main()
+    entry = {
+        "source": source_digest(),
+        "digest": workspace_digest(workspace),
+        "uploaded": cache.get("uploaded"),
+    }
+    return workspace, entry
+
+
+def load_workspace(cache: dict) -> Tuple[Workspace, dict, bool]:
     """
-    # colours, shapes and other diagram styling
-    styles = views.configuration.styles
-    styles.add(ElementStyle(tag=Tags.SOFTWARE_SYSTEM, background="#1168bd", color="#ffffff"))
-    styles.add(ElementStyle(tag=Tags.CONTAINER, background="#438dd5", color="#ffffff"))
-    styles.add(ElementStyle(tag=Tags.COMPONENT, background="#85bbf0", color="#000000"))
-    styles.add(ElementStyle(tag=Tags.PERSON, background="#08427b", color="#ffffff", shape=Shape.Person, font_size=22,))
-    styles.add(ElementStyle(tag=existing_system_tag, background="#999999", color="#ffffff"))
-    styles.add(ElementStyle(tag=business_staff_tag, background="#999999", color="#ffffff"))
-    styles.add(ElementStyle(tag=web_browser_tag, shape=Shape.WebBrowser))
-    styles.add(ElementStyle(tag=mobile_app_tag, shape=Shape.MobileDeviceLandscape))
-    styles.add(ElementStyle(tag=database_tag, shape=Shape.Cylinder))
-    styles.add(ElementStyle(tag=failover_tag, opacity=25))
-    styles.add(ElementStyle(tag=bounded_context_tag, shape=Shape.Hexagon,background="#facc2e"))
-    styles.add(RelationshipStyle(tag=failover_tag, opacity=25, position=70))
-    
-    
+    Return the prebuilt workspace, rebuilding it if the example changed.
 
-    return workspace
+    A missing, truncated or otherwise unreadable cached workspace is rebuilt, too.
+    The returned flag tells whether the workspace was rebuilt.
+    """
+    if cache.get("source") == source_digest():
+        try:
+            return Workspace.load(WORKSPACE_CACHE_PATH), cache, False
+        except (EOFError, OSError, ValueError):
+            # gzip raises EOFError for truncated files; pydantic's ValidationError
+            # and JSON decoding errors are ValueErrors.
+            pass
+    return (*build_workspace(cache), True)
+
+
+def export_workspace(
+    workspace: Workspace, output: Path, export_format: str = "plantuml"
+) -> None:
+    """Export the workspace's diagrams locally using the Structurizr CLI."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "workspace.json")
+        workspace.dump(path)
+        subprocess.run(
+            [
+                "structurizr-cli",
+                "export",
+                "-workspace",
+                str(path),
+                "-format",
+                export_format,
+                "-output",
+                str(output),
+            ],
+            check=True,
+        )
 
-from structurizr import StructurizrClient, StructurizrClientSettings
 
 if __name__ == "__main__":
     #logging.basicConfig(level="INFO")
-    workspace = main()
-    settings = StructurizrClientSettings(
-        workspace_id=70818,
-        api_key='ca5604a1-4407-42f6-9dab-9384b65c8152',
-        api_secret='aef76fda-e72c-49c4-838c-f42dd6f48379',
-    )
-    client = StructurizrClient(settings=settings)
-    
-    workspace.id = client.get_workspace().id
-    client.put_workspace(workspace)
+    workspace, entry, rebuilt = load_workspace(read_cache())
+    if os.environ.get("STRUCTURIZR_OFFLINE"):
+        export_workspace(workspace, Path("diagrams"))
+    elif entry["digest"] != entry["uploaded"]:
+        # Only connect to the API when there is something to upload.
+        from structurizr import StructurizrClient, StructurizrClientSettings
+
+        settings = StructurizrClientSettings(
+            workspace_id=70818,
+            api_key='ca5604a1-4407-42f6-9dab-9384b65c8152',
+            api_secret='aef76fda-e72c-49c4-838c-f42dd6f48379',
+        )
+        client = StructurizrClient(settings=settings)
+        workspace.id = client.workspace_id
+        client.put_workspace(workspace)
+        entry["uploaded"] = entry["digest"]
+    write_cache(entry, workspace if rebuilt else None)
@@ -0,0 +1,29 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Prebuild the 'SCV' example workspace.
+
+Run this once after editing `examen_final.py`. Running the example afterwards
+loads the prebuilt workspace from the cache instead of constructing it again.
+"""
+
+
+from examen_final import build_workspace, read_cache, write_cache
+
+
+if __name__ == "__main__":
+    workspace, entry = build_workspace(read_cache())
+    write_cache(entry, workspace)
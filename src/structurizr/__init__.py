@@ -20,10 +20,36 @@ __author__ = "Moritz E. Beber"
 __email__ = "midnighter@posteo.net"
 
 
+import importlib
+import sys
+
 from .helpers import show_versions
 from .workspace import Workspace, WorkspaceIO
-from .api import (
-    StructurizrClient,
-    StructurizrClientException,
-    StructurizrClientSettings,
+
+
+_API_NAMES = (
+    "StructurizrClient",
+    "StructurizrClientException",
+    "StructurizrClientSettings",
 )
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    from .api import (
+        StructurizrClient,
+        StructurizrClientException,
+        StructurizrClientSettings,
+    )
+else:
+
+    def __getattr__(name: str):
+        """Import the API classes, and with them httpx, only when first requested."""
+        if name == "api":
+            return importlib.import_module(".api", __name__)
+        if name in _API_NAMES:
+            return getattr(importlib.import_module(".api", __name__), name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def __dir__():
+        """List the lazily imported API names alongside the module attributes."""
+        return sorted(set(globals()).union(("api",), _API_NAMES))
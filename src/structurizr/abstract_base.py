@@ -25,6 +25,8 @@ __all__ = ("AbstractBase",)
 class AbstractBase(ABC):
     """Define common business logic through an abstract base class."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """
         Initialize an abstract base class.
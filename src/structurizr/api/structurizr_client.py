@@ -25,10 +25,11 @@ from base64 import b64encode
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 from urllib.parse import unquote_plus
 
 import httpx
+from pydantic.json import pydantic_encoder
 
 from ..workspace import Workspace, WorkspaceIO
 from .api_response import APIResponse
@@ -36,6 +37,11 @@ from .structurizr_client_exception import StructurizrClientException
 from .structurizr_client_settings import StructurizrClientSettings
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 __all__ = ("StructurizrClient",)
 
 
@@ -200,12 +206,13 @@ class StructurizrClient:
         ws_io.last_modified_date = datetime.now(timezone.utc)
         ws_io.last_modified_agent = self.agent
         ws_io.last_modified_user = self.user
-        workspace_json = ws_io.json()
-        logger.debug(workspace_json)
+        workspace_json = self._serialize(ws_io)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", workspace_json.decode("utf-8"))
         request = self._client.build_request(
             method="PUT",
             url=self._workspace_url,
-            data=workspace_json,
+            content=workspace_json,
         )
         request.headers.update(
             self._add_headers(
@@ -289,7 +296,7 @@ class StructurizrClient:
     def _add_headers(
         self,
         request: httpx.Request,
-        content: str = "",
+        content: Union[str, bytes] = "",
         content_type: str = "",
     ) -> Dict[str, str]:
         """
@@ -297,7 +304,7 @@ class StructurizrClient:
 
         Args:
             request (httpx.Request): The request to create headers for.
-            content (str): The workspace definition as JSON.
+            content (str or bytes): The workspace definition as JSON.
             content_type (str): The content MIME-type (e.g. 'application/json').
 
         Returns:
@@ -361,9 +368,21 @@ class StructurizrClient:
         ).hexdigest()
 
     @staticmethod
-    def _md5(content: str) -> str:
-        """Return the MD5 hash of the given string."""
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+    def _serialize(workspace_io: WorkspaceIO) -> bytes:
+        """Return the workspace as UTF-8 encoded JSON, using orjson if available."""
+        if orjson is None:
+            return workspace_io.json().encode("utf-8")
+        return orjson.dumps(
+            workspace_io.dict(exclude_defaults=True, exclude_none=False),
+            default=pydantic_encoder,
+        )
+
+    @staticmethod
+    def _md5(content: Union[str, bytes]) -> str:
+        """Return the MD5 hash of the given string or UTF-8 encoded bytes."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.md5(content).hexdigest()
 
     @staticmethod
     def _base64_str(content: str) -> str:
@@ -16,9 +16,17 @@
 """Provide a customized base model."""
 
 
+import json
+
 from pydantic import BaseModel as BaseModel_
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
 __all__ = ("BaseModel",)
 
 
@@ -31,6 +39,7 @@ class BaseModel(BaseModel_):
         anystr_strip_whitespace = True
         allow_population_by_field_name = True
         orm_mode = True
+        json_loads = json.loads if orjson is None else orjson.loads
 
     def dict(
         self,
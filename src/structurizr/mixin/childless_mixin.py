@@ -24,6 +24,8 @@ from ..model.element import Element
 class ChildlessMixin:
     """Define a mixin for childless element types."""
 
+    __slots__ = ()
+
     @property
     def child_elements(self) -> Iterable[Element]:
         """Return child elements (from `Element.children`)."""
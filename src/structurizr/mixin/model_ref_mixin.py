@@ -30,6 +30,8 @@ __all__ = ("ModelRefMixin",)
 class ModelRefMixin:
     """Define a model reference mixin."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         """Initialize the mixin."""
         super().__init__(**kwargs)
@@ -80,6 +80,8 @@ class Component(ChildlessMixin, StaticStructureElement):
 
     """
 
+    __slots__ = ("parent", "technology", "code_elements", "size")
+
     def __init__(
         self,
         *,
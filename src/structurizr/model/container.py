@@ -75,6 +75,8 @@ class Container(StaticStructureElement):
 
     """
 
+    __slots__ = ("parent", "technology", "_components")
+
     def __init__(
         self,
         *,
@@ -130,9 +132,17 @@ class Container(StaticStructureElement):
 
         return container
 
-    def add_component(self, **kwargs) -> Component:
-        """Add a new component to this container."""
+    def add_component(self, *, tags: Iterable[str] = (), **kwargs) -> Component:
+        """
+        Add a new component to this container.
+
+        Args:
+            tags (iterable of str, optional): Additional tags for the component.
+            **kwargs: Provide keyword arguments for instantiating a `Component`.
+
+        """
         component = Component(**kwargs)
+        component.tags.update(tags)
         self += component
         return component
 
@@ -58,6 +58,8 @@ class Element(ModelRefMixin, ModelItem, ABC):
 
     """
 
+    __slots__ = ("_model", "name", "description", "url", "relationships")
+
     def __init__(
         self,
         *,
@@ -98,13 +100,11 @@ class Element(ModelRefMixin, ModelItem, ABC):
 
     def get_efferent_relationships(self) -> Iterator[Relationship]:
         """Return a Iterator over all outgoing relationships involving this element."""
-        return (r for r in self.get_model().get_relationships() if self is r.source)
+        return iter(self.get_model()._get_efferent_relationships(self))
 
     def get_afferent_relationships(self) -> Iterator[Relationship]:
         """Return a Iterator over all incoming relationships involving this element."""
-        return (
-            r for r in self.get_model().get_relationships() if self is r.destination
-        )
+        return iter(self.get_model()._get_afferent_relationships(self))
 
     def add_relationship(
         self,
@@ -44,6 +44,8 @@ class GroupableElement(Element, ABC):
             None if no group.
     """
 
+    __slots__ = ("group",)
+
     def __init__(self, *, group: Optional[str] = None, **kwargs):
         """Initialise a GroupableElement."""
         super().__init__(**kwargs)
@@ -77,6 +77,9 @@ class Model(AbstractBase):
     """
     Represent a software architecture model.
 
+    Additional `tags` given to the `add_*` methods of the model and its elements are
+    added after the built-in tags, so that styles for them take precedence.
+
     Attributes:
         enterprise (Enterprise): The enterprise associated with this model.
         people (set of Person): The set of people belonging to this model.
@@ -111,11 +114,13 @@ class Model(AbstractBase):
         # TODO: simply iterate attributes
         self._elements_by_id = {}
         self._relationships_by_id = {}
+        self._relationships_by_source = {}
+        self._relationships_by_destination = {}
         self._id_generator = SequentialIntegerIDGenerator()
 
     def __contains__(self, element: Element):
         """Return True if the element is in the model."""
-        return element in self.get_elements()
+        return self._elements_by_id.get(getattr(element, "id", None)) is element
 
     @property
     def software_systems(self) -> Set[SoftwareSystem]:
@@ -171,11 +176,12 @@ class Model(AbstractBase):
 
         return model
 
-    def add_person(self, person=None, **kwargs) -> Person:
+    def add_person(self, person=None, *, tags: Iterable[str] = (), **kwargs) -> Person:
         """
         Add a new person to the model.
 
         Args:
+            tags (iterable of str, optional): Additional tags for the person.
             **kwargs: Provide keyword arguments for instantiating a `Person`.
 
         Returns:
@@ -189,14 +195,18 @@ class Model(AbstractBase):
 
         """
         person = Person(**kwargs)
+        person.tags.update(tags)
         self += person
         return person
 
-    def add_software_system(self, name: str, **kwargs) -> SoftwareSystem:
+    def add_software_system(
+        self, name: str, *, tags: Iterable[str] = (), **kwargs
+    ) -> SoftwareSystem:
         """
         Add a new software system to the model.
 
         Args:
+            tags (iterable of str, optional): Additional tags for the software system.
             **kwargs: Provide keyword arguments for instantiating a `SoftwareSystem`
                 (recommended).
 
@@ -211,12 +221,13 @@ class Model(AbstractBase):
 
         """
         software_system = SoftwareSystem(name=name, **kwargs)
+        software_system.tags.update(tags)
         self += software_system
         return software_system
 
     def __iadd__(self, element: Element) -> "Model":
         """Add a newly constructed element to the model."""
-        if element in self.get_elements():
+        if element in self:
             return self
         if isinstance(element, Person):
             if any(element.name == p.name for p in self.people):
@@ -313,6 +324,35 @@ class Model(AbstractBase):
         self._add_relationship(relationship, create_implied_relationships)
         return relationship
 
+    def add_relationships(
+        self,
+        relationships: Iterable[Relationship],
+        *,
+        create_implied_relationships: bool = True,
+    ) -> List[Relationship]:
+        """
+        Add several relationships to the model at once.
+
+        Args:
+            relationships (iterable of Relationship): The relationships to add, each
+                with its source and destination set.
+            create_implied_relationships (bool, optional): If `True` (default) then use
+                the `implied_relationship_strategy` to create relationships implied by
+                each of them.
+
+        Returns:
+            list: The given relationships in order.
+
+        Raises:
+            ValueError: When a relationship with the same ID already exists.
+
+        """
+        relationships = list(relationships)
+        add_relationship = self._add_relationship
+        for relationship in relationships:
+            add_relationship(relationship, create_implied_relationships)
+        return relationships
+
     def get_element(self, id: str) -> Optional[Element]:
         """
         Retrieve an element by its identifier if it exists.
@@ -343,6 +383,14 @@ class Model(AbstractBase):
         """Return an iterator over all relationships contained in this model."""
         return self._relationships_by_id.values()
 
+    def _get_efferent_relationships(self, element: Element) -> List[Relationship]:
+        """Return the relationships whose source is the given element."""
+        return self._relationships_by_source.get(element, [])
+
+    def _get_afferent_relationships(self, element: Element) -> List[Relationship]:
+        """Return the relationships whose destination is the given element."""
+        return self._relationships_by_destination.get(element, [])
+
     def get_elements(self) -> ValuesView[Element]:
         """Return an iterator over all elements contained in this model."""
         return self._elements_by_id.values()
@@ -371,8 +419,14 @@ class Model(AbstractBase):
     def _add_relationship(
         self, relationship: Relationship, create_implied_relationships: bool
     ):
-        if relationship in self.get_relationships():
+        if self._relationships_by_id.get(relationship.id) is relationship:
             return
+        if relationship.source not in self:
+            # Relationships are serialized through their source element.
+            raise RuntimeError(
+                f"You must add this {type(relationship.source).__name__} element to "
+                f"a model instance first."
+            )
         if not relationship.id:
             relationship.id = self._id_generator.generate_id()
         elif relationship.id in self._elements_by_id:
@@ -385,9 +439,7 @@ class Model(AbstractBase):
                 f"{relationship} has the same ID as "
                 f"{self._relationships_by_id[relationship.id]}."
             )
-        relationship.source.add_relationship(
-            relationship, create_implied_relationships=False
-        )
+        relationship.source.relationships.add(relationship)
         self._add_relationship_to_internal_structures(relationship)
 
         if create_implied_relationships:
@@ -395,4 +447,10 @@ class Model(AbstractBase):
 
     def _add_relationship_to_internal_structures(self, relationship: Relationship):
         self._relationships_by_id[relationship.id] = relationship
+        self._relationships_by_source.setdefault(relationship.source, []).append(
+            relationship
+        )
+        self._relationships_by_destination.setdefault(
+            relationship.destination, []
+        ).append(relationship)
         self._id_generator.found(relationship.id)
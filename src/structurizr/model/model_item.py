@@ -45,7 +45,7 @@ class ModelItemIO(BaseModel, ABC):
     id: str = Field(default="")
     tags: List[str] = Field(default=())
     properties: Dict[str, str] = Field(default={})
-    perspectives: List[PerspectiveIO] = Field(default=())
+    perspectives: List[PerspectiveIO] = Field(default=[])
 
     @validator("tags", pre=True)
     def split_tags(cls, tags: Union[str, Iterable[str]]) -> List[str]:
@@ -74,6 +74,8 @@ class ModelItem(AbstractBase, ABC):
 
     """
 
+    __slots__ = ("id", "tags", "properties", "perspectives")
+
     def __init__(
         self,
         *,
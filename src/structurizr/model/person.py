@@ -53,6 +53,8 @@ class Person(ChildlessMixin, StaticStructureElement):
 
     """
 
+    __slots__ = ("location",)
+
     def __init__(self, *, location: Location = Location.Unspecified, **kwargs) -> None:
         """Initialise a Person."""
         super().__init__(**kwargs)
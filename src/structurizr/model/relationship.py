@@ -16,6 +16,7 @@
 """Provide the relationship model."""
 
 
+import sys
 from typing import TYPE_CHECKING, Optional
 
 from pydantic import Field
@@ -73,6 +74,16 @@ class Relationship(ModelItem):
 
     """
 
+    __slots__ = (
+        "source",
+        "_source_id",
+        "destination",
+        "_destination_id",
+        "description",
+        "technology",
+        "linked_relationship_id",
+    )
+
     def __init__(
         self,
         *,
@@ -92,8 +103,10 @@ class Relationship(ModelItem):
         self._source_id = source_id
         self.destination = destination
         self._destination_id = destination_id
-        self.description = description
-        self.technology = technology
+        # Descriptions and technologies repeat across many relationships, most of all
+        # in hydrated workspaces where each one is a separately parsed string.
+        self.description = _intern(description)
+        self.technology = _intern(technology)
         self.linked_relationship_id = linked_relationship_id
 
         self.tags.add(Tags.RELATIONSHIP)
@@ -142,3 +155,8 @@ class Relationship(ModelItem):
             technology=relationship_io.technology,
             interaction_style=relationship_io.interaction_style,
         )
+
+
+def _intern(value: str) -> str:
+    """Intern exact `str` instances and leave subclasses such as enums untouched."""
+    return sys.intern(value) if type(value) is str else value
@@ -58,6 +58,8 @@ class SoftwareSystem(StaticStructureElement):
 
     """
 
+    __slots__ = ("location", "_containers")
+
     def __init__(self, *, location: Location = Location.Unspecified, **kwargs) -> None:
         """Initialise a new SoftwareSystem."""
         super().__init__(**kwargs)
@@ -81,12 +83,25 @@ class SoftwareSystem(StaticStructureElement):
         return self.containers
 
     def add_container(
-        self, name: str, description: str = "", technology: str = "", **kwargs
+        self,
+        name: str,
+        description: str = "",
+        technology: str = "",
+        *,
+        tags: Iterable[str] = (),
+        **kwargs,
     ) -> Container:
-        """Construct a new `Container` and add to this system and its model."""
+        """
+        Construct a new `Container` and add to this system and its model.
+
+        Args:
+            tags (iterable of str, optional): Additional tags for the container.
+
+        """
         container = Container(
             name=name, description=description, technology=technology, **kwargs
         )
+        container.tags.update(tags)
         self += container
         return container
 
@@ -51,6 +51,8 @@ class StaticStructureElement(GroupableElement, ABC):
 
     """
 
+    __slots__ = ()
+
     def uses(
         self,
         destination: Element,
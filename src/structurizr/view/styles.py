@@ -62,6 +62,30 @@ class Styles(AbstractBase):
                 f"Can't add unknown type of style '{type(style).__name__}'."
             )
 
+    def extend(self, styles: Iterable[Union[ElementStyle, RelationshipStyle]]) -> None:
+        """
+        Add several ElementStyles and RelationshipStyles at once.
+
+        Styles are only added if all of them are of a known type.
+
+        Raises:
+            ValueError: When any of the given styles is of an unknown type.
+
+        """
+        elements = []
+        relationships = []
+        for style in styles:
+            if isinstance(style, ElementStyle):
+                elements.append(style)
+            elif isinstance(style, RelationshipStyle):
+                relationships.append(style)
+            else:
+                raise ValueError(
+                    f"Can't add unknown type of style '{type(style).__name__}'."
+                )
+        self.elements.extend(elements)
+        self.relationships.extend(relationships)
+
     def add_element_style(self, **kwargs) -> None:
         """
         Add a new element style.
@@ -16,8 +16,17 @@
 """Provide a set of views onto a software architecture model."""
 
 
-from itertools import chain
-from typing import TYPE_CHECKING, Iterable, List, Optional, Type, TypeVar
+import sys
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 from pydantic import Field
 
@@ -36,8 +45,8 @@ from .system_landscape_view import SystemLandscapeView, SystemLandscapeViewIO
 from .view import View
 
 
-if TYPE_CHECKING:
-    from ..model import Model  # pragma: no cover
+if TYPE_CHECKING:  # pragma: no cover
+    from ..model import Element, Model, Relationship
 
 
 ConcreteView = TypeVar(
@@ -55,6 +64,19 @@ ConcreteView = TypeVar(
 __all__ = ("ViewSet", "ViewSetIO")
 
 
+_VIEW_TYPES = frozenset(
+    (
+        ComponentView,
+        ContainerView,
+        DeploymentView,
+        DynamicView,
+        FilteredView,
+        SystemContextView,
+        SystemLandscapeView,
+    )
+)
+
+
 class ViewSetIO(BaseModel):
     """
     Define a set of views onto a software architecture model.
@@ -85,6 +107,8 @@ class ViewSet(ModelRefMixin, AbstractBase):
     Views include static views, dynamic views and deployment views.
     """
 
+    __slots__ = ("_model", "_views", "_views_by_type", "_configuration", "__weakref__")
+
     def __init__(
         self,
         *,
@@ -103,7 +127,9 @@ class ViewSet(ModelRefMixin, AbstractBase):
     ) -> None:
         """Initialize a view set."""
         super().__init__(**kwargs)
-        all_views = chain(
+        self._views = {}
+        self._views_by_type = defaultdict(dict)
+        for views in (
             system_landscape_views,
             system_context_views,
             container_views,
@@ -111,11 +137,24 @@ class ViewSet(ModelRefMixin, AbstractBase):
             deployment_views,
             dynamic_views,
             filtered_views,
-        )
-        self._views = {view.key: view for view in all_views}
-        self.configuration = Configuration() if configuration is None else configuration
+        ):
+            for view in views:
+                self._add_view(view)
+        self._configuration = configuration
         self.set_model(model)
 
+    @property
+    def configuration(self) -> Configuration:
+        """Return the configuration of this ViewSet, creating a default on first use."""
+        if self._configuration is None:
+            self._configuration = Configuration()
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, configuration: Configuration) -> None:
+        """Set the configuration of this ViewSet."""
+        self._configuration = configuration
+
     @property
     def system_landscape_views(self) -> Iterable[SystemLandscapeView]:
         """Return the SystemLandscapeViews in this ViewSet."""
@@ -159,51 +198,56 @@ class ViewSet(ModelRefMixin, AbstractBase):
     @classmethod
     def hydrate(cls, views: ViewSetIO, model: "Model") -> "ViewSet":
         """Hydrate a new ViewSet instance from its IO."""
-        system_landscape_views = []
-        for view_io in views.system_landscape_views:
-            view = SystemLandscapeView.hydrate(view_io, model=model)
-            cls._hydrate_view(view, model=model)
-            system_landscape_views.append(view)
-
-        system_context_views = []
-        for view_io in views.system_context_views:
-            software_system = model.get_software_system_with_id(
-                view_io.software_system_id
-            )
-            view = SystemContextView.hydrate(view_io, software_system=software_system)
-            cls._hydrate_view(view, model=model)
-            system_context_views.append(view)
-
-        container_views = []
-        for view_io in views.container_views:
-            software_system = model.get_software_system_with_id(
-                id=view_io.software_system_id,
-            )
-            view = ContainerView.hydrate(view_io, software_system=software_system)
-            cls._hydrate_view(view, model=model)
-            container_views.append(view)
-
-        component_views = []
-        for view_io in views.component_views:
-            container = model.get_element(view_io.container_id)
-            view = ComponentView.hydrate(view_io, container=container)
-            cls._hydrate_view(view, model=model)
-            component_views.append(view)
-
-        deployment_views = []
-        for view_io in views.deployment_views:
-            view = DeploymentView.hydrate(view_io)
-            cls._hydrate_view(view, model=model)
-            deployment_views.append(view)
-
-        dynamic_views = []
-        for view_io in views.dynamic_views:
-            element = (
-                model.get_element(view_io.element_id) if view_io.element_id else None
-            )
-            view = DynamicView.hydrate(view_io, element=element)
-            cls._hydrate_view(view, model=model)
-            dynamic_views.append(view)
+        get_element = model.get_element
+        get_relationship = model.get_relationship
+        get_software_system = model.get_software_system_with_id
+        hydrate_view = cls._hydrate_view
+
+        # Each view type is hydrated from its IO with a view type specific
+        # context; afterwards the element and relationship references are resolved.
+        hydrators = (
+            (
+                "system_landscape_views",
+                lambda view_io: SystemLandscapeView.hydrate(view_io, model=model),
+            ),
+            (
+                "system_context_views",
+                lambda view_io: SystemContextView.hydrate(
+                    view_io,
+                    software_system=get_software_system(view_io.software_system_id),
+                ),
+            ),
+            (
+                "container_views",
+                lambda view_io: ContainerView.hydrate(
+                    view_io,
+                    software_system=get_software_system(view_io.software_system_id),
+                ),
+            ),
+            (
+                "component_views",
+                lambda view_io: ComponentView.hydrate(
+                    view_io, container=get_element(view_io.container_id)
+                ),
+            ),
+            ("deployment_views", DeploymentView.hydrate),
+            (
+                "dynamic_views",
+                lambda view_io: DynamicView.hydrate(
+                    view_io,
+                    element=get_element(view_io.element_id)
+                    if view_io.element_id
+                    else None,
+                ),
+            ),
+        )
+        hydrated_views = {}
+        for name, hydrate in hydrators:
+            hydrated_views[name] = typed_views = []
+            for view_io in getattr(views, name):
+                view = hydrate(view_io)
+                hydrate_view(view, get_element, get_relationship)
+                typed_views.append(view)
 
         filtered_views = [
             FilteredView.hydrate(view_io) for view_io in views.filtered_views
@@ -213,34 +257,62 @@ class ViewSet(ModelRefMixin, AbstractBase):
             model=model,
             # TODO:
             # enterprise_context_views: Iterable[EnterpriseContextView] = (),
-            system_landscape_views=system_landscape_views,
-            system_context_views=system_context_views,
-            container_views=container_views,
-            component_views=component_views,
-            deployment_views=deployment_views,
-            dynamic_views=dynamic_views,
             filtered_views=filtered_views,
             configuration=Configuration.hydrate(views.configuration),
+            **hydrated_views,
         )
 
         # Patch up filtered views
-        for filtered_view in result.filtered_views:
-            filtered_view.view = result[filtered_view.base_view_key]
+        views_by_key = result._views
+        for filtered_view in filtered_views:
+            filtered_view.view = views_by_key[filtered_view.base_view_key]
 
         return result
 
-    @classmethod
-    def _hydrate_view(cls, view: View, model: "Model") -> None:
+    @staticmethod
+    def _hydrate_view(
+        view: View,
+        get_element: Callable[[str], Optional["Element"]],
+        get_relationship: Callable[[str], Optional["Relationship"]],
+    ) -> None:
+        """Resolve the element and relationship references of a hydrated view."""
         for element_view in view.element_views:
-            element_view.element = model.get_element(element_view.id)
+            element_view.element = get_element(element_view.id)
 
         for relationship_view in view.relationship_views:
-            relationship_view.relationship = model.get_relationship(
-                relationship_view.id
-            )
+            relationship_view.relationship = get_relationship(relationship_view.id)
 
     def _add_view(self, view: AbstractView) -> None:
-        self._views[view.key] = view
+        key = self._intern_key(view)
+        previous = self._views.get(key)
+        if previous is not None:
+            del self._views_by_type[self._get_view_type(previous)][key]
+        self._views[key] = view
+        self._views_by_type[self._get_view_type(view)][key] = view
+
+    def _add_new_view(self, view: AbstractView) -> None:
+        key = self._intern_key(view)
+        if key is None or key == "":
+            raise ValueError("A key must be specified.")
+        if key in self._views:
+            raise ValueError(f"View already exists in workspace with key '{key}'.")
+        self._views[key] = view
+        self._views_by_type[self._get_view_type(view)][key] = view
+
+    @staticmethod
+    def _get_view_type(view: AbstractView) -> Type[AbstractView]:
+        """Return the built-in view type, if any, that the given view is one of."""
+        for view_type in type(view).__mro__:
+            if view_type in _VIEW_TYPES:
+                return view_type
+        return type(view)
+
+    @staticmethod
+    def _intern_key(view: AbstractView) -> Optional[str]:
+        """Intern the key of a view in place and return it."""
+        if type(view.key) is str:
+            view.key = sys.intern(view.key)
+        return view.key
 
     def create_system_landscape_view(
         self, system_landscape_view: Optional[SystemLandscapeView] = None, **kwargs
@@ -258,9 +330,8 @@ class ViewSet(ModelRefMixin, AbstractBase):
             system_landscape_view = SystemLandscapeView(
                 model=self.get_model(), **kwargs
             )
-        self._ensure_key_is_specific_and_unique(system_landscape_view.key)
+        self._add_new_view(system_landscape_view)
         system_landscape_view.set_viewset(self)
-        self._add_view(system_landscape_view)
         return system_landscape_view
 
     def create_system_context_view(
@@ -279,9 +350,8 @@ class ViewSet(ModelRefMixin, AbstractBase):
         # assertThatTheSoftwareSystemIsNotNull(softwareSystem);
         if system_context_view is None:
             system_context_view = SystemContextView(**kwargs)
-        self._ensure_key_is_specific_and_unique(system_context_view.key)
+        self._add_new_view(system_context_view)
         system_context_view.set_viewset(self)
-        self._add_view(system_context_view)
         return system_context_view
 
     def create_container_view(
@@ -300,9 +370,8 @@ class ViewSet(ModelRefMixin, AbstractBase):
         # assertThatTheSoftwareSystemIsNotNull(softwareSystem);
         if container_view is None:
             container_view = ContainerView(**kwargs)
-        self._ensure_key_is_specific_and_unique(container_view.key)
+        self._add_new_view(container_view)
         container_view.set_viewset(self)
-        self._add_view(container_view)
         return container_view
 
     def create_component_view(
@@ -319,9 +388,8 @@ class ViewSet(ModelRefMixin, AbstractBase):
         """
         if component_view is None:
             component_view = ComponentView(**kwargs)
-        self._ensure_key_is_specific_and_unique(component_view.key)
+        self._add_new_view(component_view)
         component_view.set_viewset(self)
-        self._add_view(component_view)
         return component_view
 
     def create_deployment_view(self, **kwargs) -> DeploymentView:
@@ -332,10 +400,9 @@ class ViewSet(ModelRefMixin, AbstractBase):
             **kwargs: Provide keyword arguments for instantiating a `DeploymentView`
         """
         deployment_view = DeploymentView(**kwargs)
-        self._ensure_key_is_specific_and_unique(deployment_view.key)
+        self._add_new_view(deployment_view)
         deployment_view.set_viewset(self)
         deployment_view.set_model(self.model)
-        self._add_view(deployment_view)
         return deployment_view
 
     def create_dynamic_view(self, **kwargs) -> DynamicView:
@@ -346,10 +413,9 @@ class ViewSet(ModelRefMixin, AbstractBase):
             **kwagrs: Provide keyword arguments for instantiating a `DynamicView`.
         """
         dynamic_view = DynamicView(**kwargs)
-        self._ensure_key_is_specific_and_unique(dynamic_view.key)
+        self._add_new_view(dynamic_view)
         dynamic_view.set_viewset(self)
         dynamic_view.set_model(self.model)
-        self._add_view(dynamic_view)
         return dynamic_view
 
     def create_filtered_view(self, **kwargs) -> FilteredView:
@@ -360,9 +426,8 @@ class ViewSet(ModelRefMixin, AbstractBase):
             **kwargs: Provide keyword arguments for instantiating a `FilteredView`.
         """
         filtered_view = FilteredView(**kwargs)
-        self._ensure_key_is_specific_and_unique(filtered_view.key)
+        self._add_new_view(filtered_view)
         filtered_view.set_viewset(self)
-        self._add_view(filtered_view)
         return filtered_view
 
     def get_view(self, key: str) -> Optional[AbstractView]:
@@ -375,21 +440,16 @@ class ViewSet(ModelRefMixin, AbstractBase):
 
     def copy_layout_information_from(self, source: "ViewSet") -> None:
         """Copy all the layout information from a source ViewSet."""
-
-        for source_view in source.views:
-            destination_view = self.get_view(source_view.key)
-            if (
-                destination_view
-                and isinstance(destination_view, View)
-                and type(destination_view) is type(source_view)
-            ):
-                destination_view.copy_layout_information_from(source_view)
-
-    def _ensure_key_is_specific_and_unique(self, key: str) -> None:
-        if key is None or key == "":
-            raise ValueError("A key must be specified.")
-        if key in self._views:
-            raise ValueError(f"View already exists in workspace with key '{key}'.")
+        # Layout information is only exchanged between views of the same type.
+        for view_type, source_views in source._views_by_type.items():
+            destination_views = self._views_by_type.get(view_type)
+            if not destination_views or not issubclass(view_type, View):
+                continue
+            for key, source_view in source_views.items():
+                destination_view = destination_views.get(key)
+                if type(destination_view) is type(source_view):
+                    destination_view.copy_layout_information_from(source_view)
 
     def _get_typed_views(self, view_type: Type[ConcreteView]) -> Iterable[ConcreteView]:
-        return (view for view in self._views.values() if isinstance(view, view_type))
+        # Views are indexed by their built-in view type, subclasses included.
+        return list(self._views_by_type.get(view_type, {}).values())
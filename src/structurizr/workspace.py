@@ -218,6 +218,7 @@ class Workspace(AbstractBase):
         filename: Union[str, Path],
         *,
         zip: Optional[bool] = None,
+        compresslevel: int = 9,
         indent: Optional[int] = None,
         **kwargs
     ):
@@ -230,13 +231,19 @@ class Workspace(AbstractBase):
         Arguments:
             filename: filename to write to.
             zip: if specified then controls whether the contents are gzipped.
+            compresslevel: the gzip compression level from 0 to 9 (default 9), where
+                1 is the fastest.
             indent: if specified then pretty-print the JSON with given indent.
             kwargs: other arguments to pass through to `json.dumps()`.
         """
         filename = Path(filename)
         if zip is None:
             zip = str(filename).endswith(".gz")
-        with gzip.open(filename, "wt") if zip else filename.open("wt") as handle:
+        if zip:
+            handle = gzip.open(filename, "wt", compresslevel=compresslevel)
+        else:
+            handle = filename.open("wt")
+        with handle:
             handle.write(self.dumps(indent=indent, **kwargs))
 
     def dumps(self, indent: Optional[int] = None, **kwargs):
@@ -144,6 +144,21 @@ def test_save_and_load_workspace_to_gzipped_file(monkeypatch, tmp_path: Path):
     assert json.loads(actual.json()) == json.loads(expected.json())
 
 
+def test_save_workspace_with_compression_level(monkeypatch, tmp_path: Path):
+    """Test that the gzip compression level is passed on."""
+    monkeypatch.syspath_prepend(EXAMPLES)
+    example = import_module("getting_started")
+    workspace = example.main()
+
+    fast = tmp_path / "fast.json.gz"
+    small = tmp_path / "small.json.gz"
+    workspace.dump(fast, compresslevel=1, indent=2)
+    workspace.dump(small, indent=2)
+
+    assert fast.stat().st_size > small.stat().st_size
+    assert Workspace.load(fast).name == workspace.name
+
+
 def test_workspace_overridding_zip_flag(monkeypatch, tmp_path: Path):
     """Test that default zipping can be overridden explicitly."""
     monkeypatch.syspath_prepend(EXAMPLES)
@@ -16,8 +16,9 @@
 """Ensure the expected behaviour of the Structurizr client."""
 
 
+import json
 from collections import namedtuple
-from datetime import datetime
+from datetime import datetime, timezone
 from gzip import GzipFile
 from pathlib import Path
 from typing import List
@@ -29,7 +30,7 @@ from pytest_mock import MockerFixture
 
 from structurizr.api.structurizr_client import StructurizrClient
 from structurizr.api.structurizr_client_exception import StructurizrClientException
-from structurizr.workspace import Workspace
+from structurizr.workspace import Workspace, WorkspaceIO
 
 
 MockSettings = namedtuple(
@@ -79,7 +80,11 @@ def test_repr(client):
 
 
 @pytest.mark.parametrize(
-    "content, expected", [("", "d41d8cd98f00b204e9800998ecf8427e")]
+    "content, expected",
+    [
+        ("", "d41d8cd98f00b204e9800998ecf8427e"),
+        (b"", "d41d8cd98f00b204e9800998ecf8427e"),
+    ],
 )
 def test_md5(client, content, expected):
     """
@@ -91,6 +96,22 @@ def test_md5(client, content, expected):
     assert client._md5(content) == expected
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize(mocker: MockerFixture, use_orjson: bool):
+    """Expect the same JSON document with and without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        mocker.patch("structurizr.api.structurizr_client.orjson", None)
+    workspace = Workspace(name="Workspace 1", description="", id=19)
+    workspace.model.add_person(name="User", id="1")
+    ws_io = WorkspaceIO.from_orm(workspace)
+    ws_io.last_modified_date = datetime(2021, 6, 10, tzinfo=timezone.utc)
+    content = StructurizrClient._serialize(ws_io)
+    assert isinstance(content, bytes)
+    assert json.loads(content) == json.loads(ws_io.json())
+
+
 def test_create_archive_filename(client):
     """Expect a specific format for the archive file name."""
     path = client._create_archive_filename()
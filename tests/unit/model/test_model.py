@@ -16,7 +16,14 @@
 
 import pytest
 
-from structurizr.model import Component, Container, Model, Person, SoftwareSystem
+from structurizr.model import (
+    Component,
+    Container,
+    Model,
+    Person,
+    Relationship,
+    SoftwareSystem,
+)
 from structurizr.model.deployment_node import DeploymentNode
 
 
@@ -44,6 +51,35 @@ def test_model_add_relationship_twice_ignored(empty_model: Model):
     assert set(empty_model.get_relationships()) == {relationship}
 
 
+def test_model_add_relationships(empty_model: Model):
+    """Test adding several relationships at once."""
+    sys1 = empty_model.add_software_system(name="sys1")
+    sys2 = empty_model.add_software_system(name="sys2")
+    relationships = [
+        Relationship(source=sys1, destination=sys2, description="Uses"),
+        Relationship(source=sys2, destination=sys1, description="Calls back"),
+    ]
+    assert empty_model.add_relationships(iter(relationships)) == relationships
+    assert set(empty_model.get_relationships()) == set(relationships)
+    assert sys1.relationships == {relationships[0]}
+    assert sys2.relationships == {relationships[1]}
+    assert all(r.id for r in relationships)
+
+
+def test_model_indexes_relationships_by_element(empty_model: Model):
+    """Test that efferent and afferent relationships are found in insertion order."""
+    sys1 = empty_model.add_software_system(name="sys1")
+    sys2 = empty_model.add_software_system(name="sys2")
+    sys3 = empty_model.add_software_system(name="sys3")
+    r1 = sys1.uses(sys2)
+    r2 = sys3.uses(sys2)
+    r3 = sys1.uses(sys3)
+    assert list(sys1.get_efferent_relationships()) == [r1, r3]
+    assert list(sys2.get_afferent_relationships()) == [r1, r2]
+    assert list(sys2.get_efferent_relationships()) == []
+    assert list(sys1.get_afferent_relationships()) == []
+
+
 def test_model_cannot_add_relationship_with_same_id_as_existing(empty_model: Model):
     """Ensure you can't add two relationships with the same ID."""
     sys1 = empty_model.add_software_system(name="sys1")
@@ -65,6 +101,14 @@ def test_model_cannot_add_relationship_with_same_id_as_element(empty_model: Mode
         empty_model.add_relationship(source=sys1, destination=sys2, id=sys1.id)
 
 
+def test_model_cannot_add_relationship_from_foreign_source(empty_model: Model):
+    """Ensure that a relationship's source must be part of the model."""
+    system = empty_model.add_software_system(name="sys1")
+    with pytest.raises(RuntimeError, match="add this Person element"):
+        empty_model.add_relationship(source=Person(name="loose"), destination=system)
+    assert list(empty_model.get_relationships()) == []
+
+
 def test_model_add_component_must_have_parent(empty_model: Model):
     """Ensure that Model rejects adding Components that aren't within a Container."""
     component = Component(name="c1")
@@ -157,6 +201,18 @@ def test_model_cannot_add_two_software_systems_with_same_name(empty_model: Model
         empty_model.add_software_system(name="Bob")
 
 
+def test_model_adds_tags_after_built_in_tags(empty_model: Model):
+    """Ensure that custom tags follow the built-in ones for styling precedence."""
+    person = empty_model.add_person(name="Bob", tags=["Staff"])
+    system = empty_model.add_software_system(name="Sys", tags=("Existing",))
+    container = system.add_container("Db", tags=["Database"])
+    component = container.add_component(name="Repo", tags=["Storage"])
+    assert list(person.tags) == ["Element", "Person", "Staff"]
+    assert list(system.tags) == ["Element", "Software System", "Existing"]
+    assert list(container.tags) == ["Element", "Container", "Database"]
+    assert list(component.tags) == ["Element", "Component", "Storage"]
+
+
 def test_model_get_software_system_bad_id(empty_model: Model):
     """Test that trying to get a system by a non-system ID returns None."""
     system = empty_model.add_software_system(name="System")
@@ -165,6 +221,17 @@ def test_model_get_software_system_bad_id(empty_model: Model):
     assert empty_model.get_software_system_with_id(container.id) is None
 
 
+def test_model_contains(empty_model: Model):
+    """Test membership by identity rather than by ID."""
+    system = empty_model.add_software_system(name="System")
+    other = Model().add_software_system(name="System")
+    assert other.id == system.id
+    assert system in empty_model
+    assert other not in empty_model
+    assert SoftwareSystem(name="Unattached") not in empty_model
+    assert "System" not in empty_model
+
+
 def test_model_add_element_twice_is_ignored(empty_model: Model):
     """Test you can't add an element with the same ID as an existing one."""
     system1 = empty_model.add_software_system(name="System")
@@ -33,3 +33,11 @@ def test_person_init(attributes):
     person = Person(**attributes)
     for attr, expected in attributes.items():
         assert getattr(person, attr) == expected
+
+
+def test_person_slots():
+    """Expect that a person does not carry an instance dictionary."""
+    person = Person(name="User")
+    assert not hasattr(person, "__dict__")
+    with pytest.raises(AttributeError):
+        person.unknown = True
@@ -15,10 +15,13 @@
 
 """Ensure the expected behaviour of relationships."""
 
+
+import json
+
 import pytest
 
 from structurizr.model.interaction_style import InteractionStyle
-from structurizr.model.relationship import Relationship
+from structurizr.model.relationship import Relationship, RelationshipIO
 from structurizr.model.tags import Tags
 
 
@@ -44,3 +47,26 @@ def test_relationship_interaction_style():
     assert Tags.SYNCHRONOUS not in relationship.tags
     assert Tags.ASYNCHRONOUS in relationship.tags
     assert relationship.interaction_style == InteractionStyle.Asynchronous
+
+
+def test_relationship_slots():
+    """Expect that a relationship does not carry an instance dictionary."""
+    relationship = Relationship()
+    assert not hasattr(relationship, "__dict__")
+    with pytest.raises(AttributeError):
+        relationship.unknown = True
+
+
+def test_relationship_interns_strings():
+    """Expect equal descriptions and technologies to share one string object."""
+    first = Relationship(description="".join(["Us", "es"]), technology="".join("JDBC"))
+    second = Relationship(description="".join(["Us", "es"]), technology="".join("JDBC"))
+    assert first.description is second.description
+    assert first.technology is second.technology
+
+
+def test_relationship_io_omits_empty_fields():
+    """Expect empty descriptions, technologies and perspectives to be left out."""
+    relationship = Relationship(id="1", source_id="2", destination_id="3")
+    data = json.loads(RelationshipIO.from_orm(relationship).json())
+    assert set(data) == {"id", "tags", "sourceId", "destinationId"}
@@ -16,9 +16,30 @@
 """Ensure the expected behaviour of the base model."""
 
 
+import pytest
+from pydantic import ValidationError
+
 from structurizr.base_model import BaseModel
 
 
+class ConcreteModel(BaseModel):
+    """Implement a concrete model for testing purposes."""
+
+    name: str
+
+
 def test_base_init():
     """Expect proper initialization from arguments."""
     BaseModel()
+
+
+@pytest.mark.parametrize("raw", ['{"name": "Bob"}', b'{"name": "Bob"}'])
+def test_base_parse_raw(raw):
+    """Expect that models are parsed from JSON strings and bytes."""
+    assert ConcreteModel.parse_raw(raw).name == "Bob"
+
+
+def test_base_parse_raw_invalid_json():
+    """Expect that malformed JSON raises a validation error."""
+    with pytest.raises(ValidationError):
+        ConcreteModel.parse_raw('{"name": ')
@@ -0,0 +1,77 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behaviour of the top level package."""
+
+
+import subprocess
+import sys
+
+import pytest
+
+import structurizr
+from structurizr import api
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="The API is imported eagerly before Python 3.7."
+)
+def test_import_does_not_load_api():
+    """Expect that importing the package does not import the API client."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, structurizr; print('structurizr.api' in sys.modules)",
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["StructurizrClient", "StructurizrClientException", "StructurizrClientSettings"],
+)
+def test_api_names(name: str):
+    """Expect that the API classes are available from the top level package."""
+    assert getattr(structurizr, name) is getattr(api, name)
+
+
+def test_api_module():
+    """Expect that the API module is available as an attribute of the package."""
+    assert structurizr.api is api
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "api",
+        "StructurizrClient",
+        "StructurizrClientException",
+        "StructurizrClientSettings",
+    ],
+)
+def test_dir_lists_api_names(name: str):
+    """Expect that the lazily imported names are listed by dir()."""
+    assert name in dir(structurizr)
+
+
+def test_unknown_name():
+    """Expect an attribute error for unknown names."""
+    with pytest.raises(AttributeError):
+        structurizr.UnknownClient
@@ -0,0 +1,42 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behaviour of the styles collection."""
+
+
+import pytest
+
+from structurizr.view.element_style import ElementStyle
+from structurizr.view.relationship_style import RelationshipStyle
+from structurizr.view.styles import Styles
+
+
+def test_styles_extend():
+    """Expect that element and relationship styles are sorted into their lists."""
+    styles = Styles()
+    element_style = ElementStyle(tag="Database")
+    relationship_style = RelationshipStyle(tag="Failover")
+    styles.extend([element_style, relationship_style])
+    assert styles.elements == [element_style]
+    assert styles.relationships == [relationship_style]
+
+
+def test_styles_extend_rejects_unknown_style():
+    """Expect that no style is added when one of them has an unknown type."""
+    styles = Styles()
+    with pytest.raises(ValueError, match="unknown type of style 'str'"):
+        styles.extend([ElementStyle(tag="Database"), "Failover"])
+    assert styles.elements == []
+    assert styles.relationships == []
@@ -12,11 +12,13 @@
 
 """Ensure the correct behaviour of ViewSet."""
 
+import sys
 from typing import Iterable
 
 import pytest
 
 from structurizr.model.model import Model
+from structurizr.view.configuration import Configuration
 from structurizr.view.container_view import ContainerView
 from structurizr.view.filtered_view import FilterMode
 from structurizr.view.paper_size import PaperSize
@@ -52,6 +54,21 @@ def test_adding_dynamic_view(empty_model):
     assert view in viewset.dynamic_views
 
 
+def test_view_set_default_configuration(empty_model):
+    """Expect that a default configuration is created once on first use."""
+    viewset = ViewSet(model=empty_model)
+    configuration = viewset.configuration
+    assert isinstance(configuration, Configuration)
+    assert viewset.configuration is configuration
+
+
+def test_view_set_slots(empty_viewset):
+    """Expect that a view set does not carry an instance dictionary."""
+    assert not hasattr(empty_viewset, "__dict__")
+    with pytest.raises(AttributeError):
+        empty_viewset.unknown = True
+
+
 def test_dynamic_view_hydrated(empty_viewset):
     """Check dynamic views hydrated properly."""
     viewset = empty_viewset
@@ -84,6 +101,20 @@ def test_copying_dynamic_view_layout(empty_viewset):
     assert target_view.paper_size == PaperSize.A4_Landscape
 
 
+def test_copying_layout_requires_same_view_type(empty_viewset):
+    """Expect that layout info is not copied between views of different types."""
+    system = empty_viewset.model.add_software_system(name="sys1")
+    source_view = empty_viewset.create_dynamic_view(key="key1", description="test")
+    source_view.paper_size = PaperSize.A4_Landscape
+
+    target_viewset = ViewSet(model=empty_viewset.model)
+    target_view = target_viewset.create_container_view(
+        key="key1", description="test2", software_system=system
+    )
+    target_viewset.copy_layout_information_from(empty_viewset)
+    assert target_view.paper_size is None
+
+
 @pytest.mark.xfail(strict=True)
 def test_copying_layout(empty_model):
     """Check copying layout from other view types."""
@@ -129,6 +160,61 @@ def test_getting_view_by_key(empty_viewset):
         viewset["bogus"]
 
 
+def test_views_are_grouped_by_type(empty_viewset):
+    """Check that each typed property only returns views of that type."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    container_view = viewset.create_container_view(
+        key="container1", description="container", software_system=system1
+    )
+    context_view = viewset.create_system_context_view(
+        key="context1", description="context", software_system=system1
+    )
+
+    assert list(viewset.container_views) == [container_view]
+    assert list(viewset.system_context_views) == [context_view]
+    assert list(viewset.component_views) == []
+    assert list(viewset.views) == [container_view, context_view]
+
+
+def test_subclassed_views_are_grouped_by_base_type(empty_viewset):
+    """Expect that views of a subclassed view type are kept with their base type."""
+
+    class CustomContainerView(ContainerView):
+        pass
+
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    view = viewset.create_container_view(
+        CustomContainerView(
+            key="container1", description="container", software_system=system1
+        )
+    )
+    view.paper_size = PaperSize.A4_Landscape
+
+    assert list(viewset.container_views) == [view]
+    assert len(ViewSetIO.from_orm(viewset).container_views) == 1
+
+    target_viewset = ViewSet(model=viewset.model)
+    target_view = target_viewset.create_container_view(
+        CustomContainerView(
+            key="container1", description="container", software_system=system1
+        )
+    )
+    target_viewset.copy_layout_information_from(viewset)
+    assert target_view.paper_size == PaperSize.A4_Landscape
+
+
+def test_view_keys_are_interned(empty_viewset):
+    """Expect that views are indexed under interned keys."""
+    system = empty_viewset.model.add_software_system(name="sys1")
+    key = "".join(["context", "1"])
+    view = empty_viewset.create_system_context_view(
+        key=key, description="context", software_system=system
+    )
+    assert view.key is sys.intern(key)
+
+
 def test_no_key_raises_error(empty_viewset):
     """Test that key must be specified."""
     viewset = empty_viewset
@@ -163,6 +249,36 @@ def test_duplicate_key_raises_error(empty_viewset):
         )
 
 
+def test_rejected_duplicate_view_is_not_indexed(empty_viewset):
+    """Expect that a view rejected for its duplicate key is not added."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+
+    view = viewset.create_container_view(
+        key="container1", description="container", software_system=system1
+    )
+    with pytest.raises(ValueError, match="View already exists"):
+        viewset.create_system_context_view(
+            key="container1", description="context", software_system=system1
+        )
+    assert viewset["container1"] is view
+    assert list(viewset.system_context_views) == []
+
+
+def test_adding_same_view_twice_raises_error(empty_viewset):
+    """Expect that the same view instance cannot be added twice."""
+    viewset = empty_viewset
+    system1 = viewset.model.add_software_system(name="sys1")
+    view = ContainerView(
+        key="container1", description="container", software_system=system1
+    )
+
+    viewset.create_container_view(container_view=view)
+    with pytest.raises(ValueError, match="View already exists"):
+        viewset.create_container_view(container_view=view)
+    assert list(viewset.container_views) == [view]
+
+
 def count(iterable: Iterable) -> int:
     """Count items in an iterable, as len doesn't work on generators."""
     return sum(1 for x in iterable)